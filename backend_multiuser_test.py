@@ -1,19 +1,105 @@
 #!/usr/bin/env python3
 
+import certifi
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 import sys
 import json
+import os
+import socket
+import ssl
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, Any, Optional
 import time
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Upper bound on in-flight requests across the whole suite
+MAX_CONCURRENCY = 8
+
+# API endpoints, relative to the /api/ prefix
+EP_REGISTER = "auth/register"
+EP_ME = "auth/me"
+EP_FOLDERS = "folders"
+EP_PROJECTS = "projects"
+EP_PROJECT = "projects/{project_id}"
+EP_PROJECT_PLAY = "projects/{project_id}/play"
+EP_COMPILE = "jmon/compile"
+EP_STATS = "analytics/stats"
+EP_ACTIVITY = "analytics/activity?days=7"
+
+RESULTS_JSONL_PATH = '/app/backend_multiuser_test_results.jsonl'
+
+STATUS_LABELS = {True: "✅ PASS", False: "❌ FAIL"}
+
+# Header templates shared by every request; never mutated
+ANONYMOUS_HEADERS = {'Content-Type': 'application/json'}
+
+
+def dumps_json(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def bearer_headers(token: str) -> Dict[str, str]:
+    """Build the request headers authenticating as token"""
+    return {**ANONYMOUS_HEADERS, 'Authorization': f'Bearer {token}'}
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets keep TCP_NODELAY, enable TCP keep-alive
+    and optionally share one preloaded SSL context"""
+    socket_options = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    ]
+
+    def __init__(self, *args, ssl_context: Optional[ssl.SSLContext] = None, **kwargs):
+        self.ssl_context = ssl_context
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.socket_options
+        if self.ssl_context is not None:
+            kwargs['ssl_context'] = self.ssl_context
+        super().init_poolmanager(*args, **kwargs)
+
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        if verify is True and self.ssl_context is not None:
+            # The shared context already trusts the CA bundle; don't reload it per socket
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
+
 class JMONMultiUserTester:
     def __init__(self, base_url="https://musicode-1.preview.emergentagent.com"):
         self.base_url = base_url
         self.api_url = f"{base_url}/api"
+        self._api_url_prefix = f"{self.api_url}/"
         self.tests_run = 0
         self.tests_passed = 0
-        self.test_results = []
+        self.failed_results = []
+        # Results are streamed to RESULTS_JSONL_PATH, truncated on the first logged test
+        self._results_fp = None
+        self._lock = threading.Lock()
+        # Output of a test running inside run_parallel is buffered here and
+        # flushed as one block, so its results stay under its own header
+        self._local = threading.local()
+        
+        # One unique suffix per run keeps generated usernames/emails consistent
+        # and avoids collisions between parallel tester processes
+        self._run_suffix = f"{int(time.time())}_{os.getpid()}"
         
         # User tokens and IDs for testing
         self.user1_token = None
@@ -21,54 +107,123 @@ class JMONMultiUserTester:
         self.user2_token = None
         self.user2_id = None
         
+        # Request headers built once per user after registration
+        self.user1_headers = None
+        self.user2_headers = None
+        
         # Created resources for cleanup
         self.user1_folder_id = None
         self.user2_folder_id = None
         self.user1_project_id = None
         self.user2_project_id = None
 
+        # Shared session so every request reuses pooled keep-alive connections;
+        # both users go through the same pool and SSL context, isolated only by
+        # their Authorization headers
+        self.ssl_context = ssl.create_default_context(cafile=certifi.where())
+        self.session = requests.Session()
+        adapter = KeepAliveHTTPAdapter(
+            ssl_context=self.ssl_context,
+            pool_connections=4,
+            pool_maxsize=10,
+            pool_block=False,
+            # Connect errors are retried for every method, since nothing was sent;
+            # read timeouts and gateway errors only for idempotent methods, so a
+            # registration or create is never replayed
+            max_retries=Retry(
+                total=3,
+                connect=2,
+                read=2,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Accept': 'application/json'
+        })
+
+        # One bounded worker pool shared by every concurrent phase of the suite
+        self._executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENCY)
+
+    def close(self):
+        """Release pooled connections, worker threads and the results file"""
+        self._executor.shutdown(wait=True)
+        self.session.close()
+        if self._results_fp is not None:
+            self._results_fp.close()
+            self._results_fp = None
+
     def log_test(self, name: str, success: bool, details: str = ""):
         """Log test result"""
-        self.tests_run += 1
-        if success:
-            self.tests_passed += 1
-        
         result = {
             "test_name": name,
             "success": success,
             "details": details,
             "timestamp": datetime.utcnow().isoformat()
         }
-        self.test_results.append(result)
         
-        status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status} - {name}")
-        if details:
-            print(f"    Details: {details}")
+        with self._lock:
+            self.tests_run += 1
+            if success:
+                self.tests_passed += 1
+            if self._results_fp is None:
+                self._results_fp = open(RESULTS_JSONL_PATH, 'wb')
+            self._results_fp.write(dumps_json(result) + b'\n')
+            if not success:
+                self.failed_results.append(result)
+            
+            line = f"{STATUS_LABELS[success]} - {name}"
+            if details:
+                line += f"\n    Details: {details}"
+            self.emit(line)
 
-    def make_request(self, method: str, endpoint: str, data: Dict[str, Any] = None, token: str = None) -> tuple:
+    def emit(self, text: str):
+        """Write a line of output, or buffer it when called from a parallel test"""
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is not None:
+            buffer.append(text)
+        else:
+            sys.stdout.write(text + "\n")
+
+    def _run_buffered(self, test):
+        """Run test with its output buffered, then print it in one piece"""
+        self._local.buffer = []
+        try:
+            test()
+        finally:
+            output, self._local.buffer = self._local.buffer, None
+            with self._lock:
+                sys.stdout.write("".join(text + "\n" for text in output))
+
+    def run_parallel(self, *tests):
+        """Run independent test methods concurrently over the shared session"""
+        futures = [self._executor.submit(self._run_buffered, test) for test in tests]
+        for future in as_completed(futures):
+            future.result()
+
+    def make_requests(self, *requests_args) -> list:
+        """Issue independent requests as one concurrent burst, preserving order"""
+        return list(self._executor.map(lambda args: self.make_request(*args), requests_args))
+
+    def make_request(self, method: str, endpoint: str, data: Dict[str, Any] = None, headers: Dict[str, str] = None) -> tuple:
         """Make HTTP request with optional authentication"""
-        url = f"{self.api_url}/{endpoint}" if not endpoint.startswith('http') else endpoint
-        headers = {'Content-Type': 'application/json'}
+        url = endpoint if endpoint.startswith('http') else self._api_url_prefix + endpoint
+        headers = headers or ANONYMOUS_HEADERS
         
-        if token:
-            headers['Authorization'] = f'Bearer {token}'
-
         try:
-            if method == 'GET':
-                response = requests.get(url, headers=headers, timeout=10)
-            elif method == 'POST':
-                response = requests.post(url, json=data, headers=headers, timeout=10)
-            elif method == 'PUT':
-                response = requests.put(url, json=data, headers=headers, timeout=10)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=headers, timeout=10)
+            # Every header template already declares Content-Type: application/json
+            body = dumps_json(data) if data is not None else None
+            response = self.session.request(method, url, data=body, headers=headers, timeout=10)
 
             try:
-                response_data = response.json() if response.text else {}
-            except:
+                response_data = response.json()
+            except ValueError:
                 response_data = {}
-
+            
             return response.status_code, response_data
 
         except requests.exceptions.RequestException as e:
@@ -76,20 +231,21 @@ class JMONMultiUserTester:
 
     def test_user_registration(self):
         """Test user registration functionality"""
-        print(f"\n🔍 Testing User Registration...")
+        self.emit(f"\n🔍 Testing User Registration...")
         
         # Test User 1 Registration
         user1_data = {
-            "username": f"testuser1_{int(time.time())}",
-            "email": f"test1_{int(time.time())}@example.com",
+            "username": f"testuser1_{self._run_suffix}",
+            "email": f"test1_{self._run_suffix}@example.com",
             "password": "TestPassword123!",
             "full_name": "Test User One"
         }
         
-        status, response = self.make_request("POST", "auth/register", user1_data)
+        status, response = self.make_request("POST", EP_REGISTER, user1_data)
         
         if status == 200 and "access_token" in response:
             self.user1_token = response["access_token"]
+            self.user1_headers = bearer_headers(self.user1_token)
             self.user1_id = response["user"]["id"]
             self.log_test("User 1 Registration", True, f"User registered with ID: {self.user1_id}")
         else:
@@ -98,16 +254,17 @@ class JMONMultiUserTester:
         
         # Test User 2 Registration
         user2_data = {
-            "username": f"testuser2_{int(time.time())}",
-            "email": f"test2_{int(time.time())}@example.com",
+            "username": f"testuser2_{self._run_suffix}",
+            "email": f"test2_{self._run_suffix}@example.com",
             "password": "TestPassword456!",
             "full_name": "Test User Two"
         }
         
-        status, response = self.make_request("POST", "auth/register", user2_data)
+        status, response = self.make_request("POST", EP_REGISTER, user2_data)
         
         if status == 200 and "access_token" in response:
             self.user2_token = response["access_token"]
+            self.user2_headers = bearer_headers(self.user2_token)
             self.user2_id = response["user"]["id"]
             self.log_test("User 2 Registration", True, f"User registered with ID: {self.user2_id}")
         else:
@@ -115,7 +272,7 @@ class JMONMultiUserTester:
             return False
         
         # Test duplicate registration (should fail)
-        status, response = self.make_request("POST", "auth/register", user1_data)
+        status, response = self.make_request("POST", EP_REGISTER, user1_data)
         
         if status == 400:
             self.log_test("Duplicate Registration Prevention", True, "Correctly prevented duplicate registration")
@@ -126,10 +283,10 @@ class JMONMultiUserTester:
 
     def test_user_authentication(self):
         """Test user login functionality"""
-        print(f"\n🔍 Testing User Authentication...")
+        self.emit(f"\n🔍 Testing User Authentication...")
         
         # Test getting current user info
-        status, response = self.make_request("GET", "auth/me", token=self.user1_token)
+        status, response = self.make_request("GET", EP_ME, headers=self.user1_headers)
         
         if status == 200 and response.get("id") == self.user1_id:
             self.log_test("Get Current User Info", True, f"Retrieved user info for {response.get('username')}")
@@ -137,7 +294,7 @@ class JMONMultiUserTester:
             self.log_test("Get Current User Info", False, f"Status: {status}, Response: {response}")
         
         # Test invalid token
-        status, response = self.make_request("GET", "auth/me", token="invalid_token")
+        status, response = self.make_request("GET", EP_ME, headers=bearer_headers("invalid_token"))
         
         if status == 401:
             self.log_test("Invalid Token Rejection", True, "Correctly rejected invalid token")
@@ -146,15 +303,22 @@ class JMONMultiUserTester:
 
     def test_folder_management(self):
         """Test folder creation and management"""
-        print(f"\n🔍 Testing Folder Management...")
+        self.emit(f"\n🔍 Testing Folder Management...")
         
-        # User 1 creates a folder
+        # User 1 and User 2 each create a folder
         folder1_data = {
             "name": "User 1 Test Folder",
             "description": "Test folder for user 1"
         }
+        folder2_data = {
+            "name": "User 2 Test Folder",
+            "description": "Test folder for user 2"
+        }
         
-        status, response = self.make_request("POST", "folders", folder1_data, self.user1_token)
+        (status, response), (status2, response2) = self.make_requests(
+            ("POST", EP_FOLDERS, folder1_data, self.user1_headers),
+            ("POST", EP_FOLDERS, folder2_data, self.user2_headers)
+        )
         
         if status == 200 and "id" in response:
             self.user1_folder_id = response["id"]
@@ -162,22 +326,14 @@ class JMONMultiUserTester:
         else:
             self.log_test("User 1 Folder Creation", False, f"Status: {status}, Response: {response}")
         
-        # User 2 creates a folder
-        folder2_data = {
-            "name": "User 2 Test Folder",
-            "description": "Test folder for user 2"
-        }
-        
-        status, response = self.make_request("POST", "folders", folder2_data, self.user2_token)
-        
-        if status == 200 and "id" in response:
-            self.user2_folder_id = response["id"]
+        if status2 == 200 and "id" in response2:
+            self.user2_folder_id = response2["id"]
             self.log_test("User 2 Folder Creation", True, f"Created folder with ID: {self.user2_folder_id}")
         else:
-            self.log_test("User 2 Folder Creation", False, f"Status: {status}, Response: {response}")
+            self.log_test("User 2 Folder Creation", False, f"Status: {status2}, Response: {response2}")
         
         # Test folder isolation - User 1 should only see their folders
-        status, response = self.make_request("GET", "folders", token=self.user1_token)
+        status, response = self.make_request("GET", EP_FOLDERS, headers=self.user1_headers)
         
         if status == 200:
             user1_folders = response
@@ -192,25 +348,15 @@ class JMONMultiUserTester:
 
     def test_project_management_and_isolation(self):
         """Test project creation and user data isolation"""
-        print(f"\n🔍 Testing Project Management and Data Isolation...")
+        self.emit(f"\n🔍 Testing Project Management and Data Isolation...")
         
-        # User 1 creates a project in their folder
+        # User 1 and User 2 each create a project in their folder
         project1_data = {
             "name": "User 1 Test Project",
             "description": "Test project for user 1",
             "folder_id": self.user1_folder_id,
             "jmon_code": "// User 1 JMON code\nconst composition = { tracks: [], tempo: 120 };\nreturn composition;"
         }
-        
-        status, response = self.make_request("POST", "projects", project1_data, self.user1_token)
-        
-        if status == 200 and "id" in response:
-            self.user1_project_id = response["id"]
-            self.log_test("User 1 Project Creation", True, f"Created project with ID: {self.user1_project_id}")
-        else:
-            self.log_test("User 1 Project Creation", False, f"Status: {status}, Response: {response}")
-        
-        # User 2 creates a project in their folder
         project2_data = {
             "name": "User 2 Test Project",
             "description": "Test project for user 2",
@@ -218,16 +364,29 @@ class JMONMultiUserTester:
             "jmon_code": "// User 2 JMON code\nconst composition = { tracks: [], tempo: 140 };\nreturn composition;"
         }
         
-        status, response = self.make_request("POST", "projects", project2_data, self.user2_token)
+        (status, response), (status2, response2) = self.make_requests(
+            ("POST", EP_PROJECTS, project1_data, self.user1_headers),
+            ("POST", EP_PROJECTS, project2_data, self.user2_headers)
+        )
         
         if status == 200 and "id" in response:
-            self.user2_project_id = response["id"]
+            self.user1_project_id = response["id"]
+            self.log_test("User 1 Project Creation", True, f"Created project with ID: {self.user1_project_id}")
+        else:
+            self.log_test("User 1 Project Creation", False, f"Status: {status}, Response: {response}")
+        
+        if status2 == 200 and "id" in response2:
+            self.user2_project_id = response2["id"]
             self.log_test("User 2 Project Creation", True, f"Created project with ID: {self.user2_project_id}")
         else:
-            self.log_test("User 2 Project Creation", False, f"Status: {status}, Response: {response}")
+            self.log_test("User 2 Project Creation", False, f"Status: {status2}, Response: {response2}")
         
-        # Test project isolation - User 1 should only see their projects
-        status, response = self.make_request("GET", "projects", token=self.user1_token)
+        # Project isolation (User 1 should only see their projects) and
+        # cross-user access (should fail) are checked in one burst
+        (status, response), (status2, response2) = self.make_requests(
+            ("GET", EP_PROJECTS, None, self.user1_headers),
+            ("GET", EP_PROJECT.format(project_id=self.user2_project_id), None, self.user1_headers)
+        )
         
         if status == 200:
             user1_projects = response
@@ -240,24 +399,21 @@ class JMONMultiUserTester:
         else:
             self.log_test("Project Data Isolation", False, f"Status: {status}, Response: {response}")
         
-        # Test cross-user project access (should fail)
-        status, response = self.make_request("GET", f"projects/{self.user2_project_id}", token=self.user1_token)
-        
-        if status == 404:
+        if status2 == 404:
             self.log_test("Cross-User Project Access Prevention", True, "User 1 cannot access User 2's project")
         else:
-            self.log_test("Cross-User Project Access Prevention", False, f"Should have failed with 404, got {status}")
+            self.log_test("Cross-User Project Access Prevention", False, f"Should have failed with 404, got {status2}")
 
     def test_jmon_compilation(self):
         """Test JMON code compilation"""
-        print(f"\n🔍 Testing JMON Compilation...")
+        self.emit(f"\n🔍 Testing JMON Compilation...")
         
         compile_data = {
             "code": "const composition = { tracks: [], tempo: 120, timeSignature: '4/4', duration: 4 }; return composition;",
             "project_id": self.user1_project_id
         }
         
-        status, response = self.make_request("POST", "jmon/compile", compile_data, self.user1_token)
+        status, response = self.make_request("POST", EP_COMPILE, compile_data, self.user1_headers)
         
         if status == 200:
             self.log_test("JMON Code Compilation", True, "Code compiled successfully")
@@ -266,9 +422,9 @@ class JMONMultiUserTester:
 
     def test_project_play_tracking(self):
         """Test project play tracking"""
-        print(f"\n🔍 Testing Project Play Tracking...")
+        self.emit(f"\n🔍 Testing Project Play Tracking...")
         
-        status, response = self.make_request("POST", f"projects/{self.user1_project_id}/play", token=self.user1_token)
+        status, response = self.make_request("POST", EP_PROJECT_PLAY.format(project_id=self.user1_project_id), headers=self.user1_headers)
         
         if status == 200:
             self.log_test("Project Play Tracking", True, "Play event tracked successfully")
@@ -277,10 +433,10 @@ class JMONMultiUserTester:
 
     def test_analytics_functionality(self):
         """Test analytics and usage stats"""
-        print(f"\n🔍 Testing Analytics Functionality...")
+        self.emit(f"\n🔍 Testing Analytics Functionality...")
         
         # Test usage stats
-        status, response = self.make_request("GET", "analytics/stats", token=self.user1_token)
+        status, response = self.make_request("GET", EP_STATS, headers=self.user1_headers)
         
         if status == 200 and "total_projects" in response:
             self.log_test("Usage Statistics", True, f"Retrieved stats: {response}")
@@ -288,7 +444,7 @@ class JMONMultiUserTester:
             self.log_test("Usage Statistics", False, f"Status: {status}, Response: {response}")
         
         # Test activity tracking
-        status, response = self.make_request("GET", "analytics/activity?days=7", token=self.user1_token)
+        status, response = self.make_request("GET", EP_ACTIVITY, headers=self.user1_headers)
         
         if status == 200:
             self.log_test("Activity Tracking", True, f"Retrieved {len(response)} activity events")
@@ -297,7 +453,7 @@ class JMONMultiUserTester:
 
     def test_project_updates(self):
         """Test project update functionality"""
-        print(f"\n🔍 Testing Project Updates...")
+        self.emit(f"\n🔍 Testing Project Updates...")
         
         update_data = {
             "name": "Updated User 1 Project",
@@ -310,7 +466,7 @@ class JMONMultiUserTester:
             }
         }
         
-        status, response = self.make_request("PUT", f"projects/{self.user1_project_id}", update_data, self.user1_token)
+        status, response = self.make_request("PUT", EP_PROJECT.format(project_id=self.user1_project_id), update_data, self.user1_headers)
         
         if status == 200:
             self.log_test("Project Update", True, "Project updated successfully")
@@ -319,10 +475,10 @@ class JMONMultiUserTester:
 
     def test_unauthorized_access(self):
         """Test unauthorized access scenarios"""
-        print(f"\n🔍 Testing Unauthorized Access Scenarios...")
+        self.emit(f"\n🔍 Testing Unauthorized Access Scenarios...")
         
         # Test accessing endpoints without token
-        status, response = self.make_request("GET", "projects")
+        status, response = self.make_request("GET", EP_PROJECTS)
         
         if status == 401 or status == 403:
             self.log_test("Unauthorized Project Access", True, "Correctly rejected request without token")
@@ -330,7 +486,7 @@ class JMONMultiUserTester:
             self.log_test("Unauthorized Project Access", False, f"Should have failed with 401/403, got {status}")
         
         # Test accessing folders without token
-        status, response = self.make_request("GET", "folders")
+        status, response = self.make_request("GET", EP_FOLDERS)
         
         if status == 401 or status == 403:
             self.log_test("Unauthorized Folder Access", True, "Correctly rejected request without token")
@@ -348,9 +504,14 @@ class JMONMultiUserTester:
         # Test user registration and authentication
         if not self.test_user_registration():
             print("❌ User registration failed, stopping tests")
+            self.close()
             return False
         
-        self.test_user_authentication()
+        # Token checks and unauthenticated probes only need registered users
+        self.run_parallel(
+            self.test_user_authentication,
+            self.test_unauthorized_access
+        )
         
         # Test folder management and isolation
         self.test_folder_management()
@@ -358,18 +519,13 @@ class JMONMultiUserTester:
         # Test project management and data isolation
         self.test_project_management_and_isolation()
         
-        # Test JMON functionality
-        self.test_jmon_compilation()
-        self.test_project_play_tracking()
-        
-        # Test analytics
-        self.test_analytics_functionality()
-        
-        # Test updates
-        self.test_project_updates()
-        
-        # Test security
-        self.test_unauthorized_access()
+        # JMON, play tracking, analytics and updates only depend on the created project
+        self.run_parallel(
+            self.test_jmon_compilation,
+            self.test_project_play_tracking,
+            self.test_analytics_functionality,
+            self.test_project_updates
+        )
 
         # Print summary
         print("\n" + "=" * 70)
@@ -382,10 +538,10 @@ class JMONMultiUserTester:
         
         if self.tests_passed < self.tests_run:
             print("\n❌ FAILED TESTS:")
-            for result in self.test_results:
-                if not result['success']:
-                    print(f"  - {result['test_name']}: {result['details']}")
+            for result in self.failed_results:
+                print(f"  - {result['test_name']}: {result['details']}")
         
+        self.close()
         return self.tests_passed == self.tests_run
 
 def main():
@@ -393,16 +549,18 @@ def main():
     success = tester.run_all_tests()
     
     # Save detailed results
-    with open('/app/backend_multiuser_test_results.json', 'w') as f:
-        json.dump({
-            'summary': {
-                'tests_run': tester.tests_run,
-                'tests_passed': tester.tests_passed,
-                'success_rate': (tester.tests_passed / tester.tests_run * 100) if tester.tests_run > 0 else 0,
-                'timestamp': datetime.utcnow().isoformat()
-            },
-            'results': tester.test_results
-        }, f, indent=2)
+    payload = {
+        'summary': {
+            'tests_run': tester.tests_run,
+            'tests_passed': tester.tests_passed,
+            'success_rate': (tester.tests_passed / tester.tests_run * 100) if tester.tests_run > 0 else 0,
+            'timestamp': datetime.utcnow().isoformat()
+        },
+        'results_file': RESULTS_JSONL_PATH,
+        'failed_results': tester.failed_results
+    }
+    with open('/app/backend_multiuser_test_results.json', 'wb') as f:
+        f.write(dumps_json(payload, indent=True))
     
     return 0 if success else 1
 